@@ -0,0 +1,33 @@
+"""
+Optional build hook for compiling the SIP message parser with mypyc.
+
+Project metadata lives in pyproject.toml and the package builds as pure
+Python by default. Set USIP_MYPYC=1 (with mypy>=1.17,<2 installed) to
+compile the hot parsing module into a C extension:
+
+    USIP_MYPYC=1 pip install --no-build-isolation .
+
+Older mypyc releases generate an import shim that fails while the
+sip_client package is still initialising, and mypy 2 no longer accepts
+the python_version = "3.8" setting from pyproject.toml.
+"""
+
+import os
+import sys
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("USIP_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only the compiled module has to pass mypy; imported modules are
+    # analysed for their types but not reported on. The extension targets
+    # the interpreter running the build, not the configured minimum.
+    ext_modules = mypycify([
+        f"--python-version={sys.version_info[0]}.{sys.version_info[1]}",
+        "--follow-imports=silent",
+        "src/sip_client/sip/messages.py",
+    ])
+
+setup(ext_modules=ext_modules)
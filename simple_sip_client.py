@@ -4,13 +4,14 @@ Simple SIP Client for voip.ms using basic socket programming
 """
 
 import socket
+import selectors
 import time
 import threading
 import hashlib
-import random
+import re
 import os
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Any, List, Tuple
 import click
 from dotenv import load_dotenv
 from rich.console import Console
@@ -22,6 +23,37 @@ load_dotenv()
 
 console = Console()
 
+# Precompiled header patterns, applied to the whole response in one pass
+_STATUS_RE = re.compile(rb"SIP/2\.0 (\d{3}) ")
+_CSEQ_RE = re.compile(rb"^CSeq:[ \t]*(\d+)[ \t]+(\S+)", re.MULTILINE | re.IGNORECASE)
+_TO_TAG_RE = re.compile(rb"^To:[^\r\n]*?tag=([^;\r\n]+)", re.MULTILINE | re.IGNORECASE)
+_CONTACT_RE = re.compile(rb"^Contact:[ \t]*(?:[^<\r\n]*<([^>\r\n]+)>|([^;\r\n]+))", re.MULTILINE | re.IGNORECASE)
+_AUTH_HEADER_RE = re.compile(rb"^(?:WWW|Proxy)-Authenticate:([^\r\n]*)", re.MULTILINE | re.IGNORECASE)
+_AUTH_PARAM_RE = re.compile(rb'\b(realm|nonce)="?([^",\r\n]*)', re.IGNORECASE)
+
+# Headers sent unchanged on every request
+_STATIC_HEADERS = b"Max-Forwards: 70\r\nUser-Agent: Python SIP Client 1.0"
+
+# sendmsg lets headers and body go out in one syscall without joining them (not on Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# Seconds to wait for the next response; re-armed after every provisional one
+_RESPONSE_TIMEOUT = 10.0
+
+# RFC 3261 retransmission timers for requests over UDP
+_T1 = 0.5
+_T2 = 4.0
+
+# Seconds between session refreshes while a call is up
+_SESSION_REFRESH_INTERVAL = 30.0
+
+# Console notes for provisional responses, keyed by status code
+_PROVISIONAL_NOTES = {
+    100: "[yellow]Call is being processed...[/yellow]",
+    180: "[blue]Phone is ringing...[/blue]",
+    183: "[blue]Session in progress...[/blue]",
+}
+
 class SimpleSIPClient:
     """Simple SIP Client using socket programming"""
     
@@ -37,258 +69,326 @@ class SimpleSIPClient:
             console.print("[red]Error: Missing SIP configuration. Please check your .env file.[/red]")
             sys.exit(1)
             
-        self.socket = None
         self.registered = False
+        self._debug = bool(os.getenv('SIP_CLIENT_DEBUG'))
         self.call_id = None
         self.local_tag = None
         self.remote_tag = None
         self.contact_uri = None
         self.cseq = 1
         self.branch = None
+        self._to_uri = None
+        
+        # One UDP socket for the lifetime of the client; its local port goes in Via/Contact
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("0.0.0.0", 0))
+        self.socket.settimeout(10)
+        self._local_port = self.socket.getsockname()[1]
         
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.socket, selectors.EVENT_READ)
+        
+        # Receive buffer reused for every incoming datagram
+        self._rxbuf = bytearray(4096)
+        self._rxview = memoryview(self._rxbuf)
+        
+        # Local host is looked up once; the server is resolved on first send
+        self._host = socket.gethostname()
+        self._server_ip = None
+        self._via_prefix = f"SIP/2.0/UDP {self._host}:{self._local_port}"
+        self._from_uri = f"<sip:{self.config['username']}@{self.config['domain']}>"
+        self._contact = f"<sip:{self.config['username']}@{self._host}:{self._local_port}>"
+        self._hdr_contact = f"Contact: {self._contact}".encode()
+        
+        # Credentials pre-encoded for digest authentication
+        self._user_b = self.config['username'].encode()
+        self._pass_b = self.config['password'].encode()
+        
+        # Built on the first INVITE; REGISTER never needs the local IP
+        self._sdp = None
+        
+    @property
+    def _server_addr(self) -> Tuple[str, int]:
+        """SIP server address, resolved once on first use"""
+        if self._server_ip is None:
+            self._server_ip = socket.gethostbyname(self.config['domain'])
+        return self._server_ip, self.config['port']
+    
+    @property
+    def _sdp_body(self) -> bytes:
+        """SDP offer - compatible with voip.ms. Only depends on username and local IP"""
+        if self._sdp is None:
+            local_ip = socket.gethostbyname(self._host)
+            self._sdp = (
+                "v=0\n"
+                f"o={self.config['username']} 123456 123456 IN IP4 {local_ip}\n"
+                "s=Python SIP Client\n"
+                f"c=IN IP4 {local_ip}\n"
+                "t=0 0\n"
+                "m=audio 10000 RTP/AVP 0 8 18 101\n"
+                "a=rtpmap:0 PCMU/8000\n"
+                "a=rtpmap:8 PCMA/8000\n"
+                "a=rtpmap:18 G729/8000\n"
+                "a=rtpmap:101 telephone-event/8000\n"
+                "a=fmtp:101 0-16\n"
+                "a=sendrecv\n"
+            ).encode()
+        return self._sdp
+    
     def generate_call_id(self):
         """Generate a unique call ID"""
-        return f"{random.randint(100000, 999999)}@{self.config['domain']}"
+        return f"{os.urandom(8).hex()}@{self.config['domain']}"
     
     def generate_tag(self):
         """Generate a unique tag"""
-        return f"{random.randint(100000, 999999)}"
+        return os.urandom(4).hex()
     
     def generate_branch(self):
         """Generate a unique branch"""
-        return f"z9hG4bK{random.randint(100000, 999999)}"
+        return "z9hG4bK" + os.urandom(4).hex()
     
-    def extract_sip_headers(self, response: str):
+    def extract_sip_headers(self, response: bytes):
         """Extract important headers from SIP response"""
-        lines = response.split('\r\n')
-        for line in lines:
-            if line.startswith('To:'):
-                # Extract remote tag from To header
-                if 'tag=' in line:
-                    self.remote_tag = line.split('tag=')[1].split(';')[0].strip()
-            elif line.startswith('Contact:'):
-                # Extract contact URI
-                if '<' in line and '>' in line:
-                    self.contact_uri = line.split('<')[1].split('>')[0].strip()
-                else:
-                    # Simple format without < >
-                    self.contact_uri = line.split('Contact:')[1].strip().split(';')[0].strip()
+        # Extract remote tag from To header
+        match = _TO_TAG_RE.search(response)
+        if match:
+            self.remote_tag = match.group(1).strip().decode()
+            self._rebuild_dialog_headers()
+        
+        # Extract contact URI, with or without < >
+        match = _CONTACT_RE.search(response)
+        if match:
+            self.contact_uri = (match.group(1) or match.group(2)).strip().decode()
+    
+    def _rebuild_dialog_headers(self):
+        """Pre-encode the From/To/Call-ID headers of the current dialog"""
+        to_uri = f"{self._to_uri};tag={self.remote_tag}" if self.remote_tag else self._to_uri
+        self._hdr_from = f"From: {self._from_uri};tag={self.local_tag}".encode()
+        self._hdr_to = f"To: {to_uri}".encode()
+        self._hdr_call_id = f"Call-ID: {self.call_id}".encode()
+    
+    def _base_headers(self, method: str, branch: Optional[str] = None) -> List[bytes]:
+        """Headers shared by every request in the current dialog
+        
+        A fresh branch is generated unless one is given.
+        """
+        return [
+            f"Via: {self._via_prefix};branch={branch or self.generate_branch()}".encode(),
+            self._hdr_from,
+            self._hdr_to,
+            self._hdr_call_id,
+            f"CSeq: {self.cseq} {method}".encode(),
+        ]
     
-    def create_sip_message(self, method: str, uri: str, headers: Dict[str, str], body: str = "") -> str:
-        """Create a SIP message"""
-        message = f"{method} {uri} SIP/2.0\r\n"
+    def create_sip_message(self, method: str, uri: str, headers: List[bytes], body: bytes = b"") -> Tuple[bytes, bytes]:
+        """Create a SIP message as separate (headers, body) buffers
         
-        for header, value in headers.items():
-            message += f"{header}: {value}\r\n"
+        Headers are given as already-encoded "Name: value" lines.
+        """
+        parts = [f"{method} {uri} SIP/2.0".encode()]
+        parts += headers
+        parts.append(_STATIC_HEADERS)
+        parts.append(f"Content-Length: {len(body)}".encode())
         
-        message += f"Content-Length: {len(body)}\r\n"
-        message += "\r\n"
-        message += body
+        return b"\r\n".join(parts) + b"\r\n\r\n", body
+    
+    def send_message(self, message: Tuple[bytes, bytes], server_addr) -> None:
+        """Send a (headers, body) message as a single datagram"""
+        if _HAS_SENDMSG:
+            self.socket.sendmsg(message, [], 0, server_addr)
+        else:
+            self.socket.sendto(b"".join(message), server_addr)
+    
+    def wait_for_response(self, request: Tuple[bytes, bytes], cseq: int, method: str) -> Optional[Tuple[int, bytes]]:
+        """Wait for a final response, reporting provisional ones as they arrive.
         
-        return message
+        The request is retransmitted with exponential backoff (T1 doubling up
+        to T2) until the server answers with anything. Responses whose CSeq
+        does not match the request (e.g. a late answer to a retransmission of
+        an earlier request) are ignored.
+        
+        Returns the (status code, response) pair, or None if the server goes
+        quiet for longer than the response timeout.
+        """
+        expected = (str(cseq).encode(), method.encode())
+        deadline = time.monotonic() + _RESPONSE_TIMEOUT
+        interval = _T1
+        next_retransmit = time.monotonic() + interval
+        seen = set()
+        
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return None
+            
+            if next_retransmit is not None and now >= next_retransmit:
+                self.send_message(request, self._server_addr)
+                interval = min(interval * 2, _T2)
+                next_retransmit = now + interval
+            
+            wake = deadline if next_retransmit is None else min(deadline, next_retransmit)
+            for _key, _events in self._sel.select(wake - now):
+                n, addr = self.socket.recvfrom_into(self._rxbuf)
+                response = bytes(self._rxview[:n])
+                
+                # Anything that is not a status line (e.g. an incoming request) is ignored
+                match = _STATUS_RE.match(response)
+                if not match:
+                    continue
+                code = int(match.group(1))
+                
+                # Stale responses belong to another transaction
+                cseq_match = _CSEQ_RE.search(response)
+                if not cseq_match or cseq_match.groups() != expected:
+                    continue
+                
+                # Drop retransmitted provisional responses we already handled
+                if code in seen:
+                    continue
+                seen.add(code)
+                next_retransmit = None
+                
+                # SIP is ASCII; only decode for display
+                if self._debug:
+                    console.print(f"[yellow]Received response:[/yellow]\n{response.decode(errors='replace')}")
+                
+                if code >= 200:
+                    return code, response
+                
+                note = _PROVISIONAL_NOTES.get(code)
+                if note:
+                    console.print(note)
+                deadline = time.monotonic() + _RESPONSE_TIMEOUT
     
     def send_register(self) -> bool:
         """Send REGISTER request"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(10)
-            
             # Generate unique identifiers
             self.call_id = self.generate_call_id()
             self.local_tag = self.generate_tag()
             self.branch = self.generate_branch()
+            self.remote_tag = None
+            self._to_uri = self._from_uri
+            self._rebuild_dialog_headers()
             
             # Create REGISTER request
             uri = f"sip:{self.config['domain']}"
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={self.branch}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{self.config['username']}@{self.config['domain']}>",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} REGISTER",
-                'Contact': f"<sip:{self.config['username']}@{socket.gethostname()}:{self.config['port']}>",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0',
-                'Expires': '3600'
-            }
+            headers = self._base_headers('REGISTER', self.branch) + [
+                self._hdr_contact,
+                b"Expires: 3600",
+            ]
             
             message = self.create_sip_message('REGISTER', uri, headers)
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Sending REGISTER request:[/yellow]\n{message}")
+            if self._debug:
+                console.print(f"[yellow]Sending REGISTER request:[/yellow]\n{b''.join(message).decode()}")
 
             # Send to server
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
             # Wait for response
-            response, addr = self.socket.recvfrom(4096)
-            response_str = response.decode()
+            result = self.wait_for_response(message, self.cseq, 'REGISTER')
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Received response:[/yellow]\n{response_str}")
-
-            console.print(f"[blue]SIP Response:[/blue]\n{response_str}")
+            if result is None:
+                console.print("[red]Registration failed: no response from server[/red]")
+                return False
             
-            if "401 Unauthorized" in response_str or "407 Proxy Authentication Required" in response_str:
+            code, response = result
+            if code in (401, 407):
                 # Handle authentication
-                return self.handle_authentication(response_str, 'REGISTER', uri)
-            elif "200 OK" in response_str:
+                return self.handle_authentication(response, 'REGISTER', uri)
+            elif code == 200:
                 self.registered = True
                 console.print("[green]✓ Successfully registered with SIP server[/green]")
                 return True
             else:
-                console.print(f"[red]Registration failed: {response_str}[/red]")
+                console.print(f"[red]Registration failed: {response.decode(errors='replace')}[/red]")
                 return False
                 
         except Exception as e:
             console.print(f"[red]Registration error: {e}[/red]")
             return False
     
-    def handle_authentication(self, response: str, method: str, uri: str) -> bool:
+    def handle_authentication(self, response: bytes, method: str, uri: str) -> bool:
         """Handle SIP authentication"""
         try:
             # Parse authentication challenge
-            auth_header = None
-            for line in response.split('\r\n'):
-                if line.startswith('WWW-Authenticate:') or line.startswith('Proxy-Authenticate:'):
-                    auth_header = line
-                    break
+            auth_header = _AUTH_HEADER_RE.search(response)
             
             if not auth_header:
                 console.print("[red]No authentication header found[/red]")
                 return False
             
             # Extract realm, nonce, etc.
-            realm = None
-            nonce = None
-            
-            parts = auth_header.split(',')
-            for part in parts:
-                part = part.strip()
-                if 'realm=' in part:
-                    realm = part.split('realm=')[1].strip('"')
-                elif 'nonce=' in part:
-                    nonce = part.split('nonce=')[1].strip('"')
+            params = {name.lower(): value for name, value in _AUTH_PARAM_RE.findall(auth_header.group(1))}
+            realm = params.get(b'realm')
+            nonce = params.get(b'nonce')
             
             if not realm or not nonce:
                 console.print("[red]Invalid authentication challenge[/red]")
                 return False
             
             # Calculate response
-            ha1 = hashlib.md5(f"{self.config['username']}:{realm}:{self.config['password']}".encode()).hexdigest()
-            ha2 = hashlib.md5(f"{method}:{uri}".encode()).hexdigest()
-            response_hash = hashlib.md5(f"{ha1}:{nonce}:{ha2}".encode()).hexdigest()
+            ha1 = hashlib.md5(b":".join((self._user_b, realm, self._pass_b))).hexdigest()
+            ha2 = hashlib.md5(b":".join((method.encode(), uri.encode()))).hexdigest()
+            response_hash = hashlib.md5(b":".join((ha1.encode(), nonce, ha2.encode()))).hexdigest()
             
             # Create authenticated request
             self.cseq += 1
             self.branch = self.generate_branch()
             
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={self.branch}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{self.config['username']}@{self.config['domain']}>",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} {method}",
-                'Contact': f"<sip:{self.config['username']}@{socket.gethostname()}:{self.config['port']}>",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0',
-                'Authorization': f'Digest username="{self.config["username"]}", realm="{realm}", nonce="{nonce}", uri="{uri}", response="{response_hash}"'
-            }
+            headers = self._base_headers(method, self.branch) + [
+                self._hdr_contact,
+                b'Authorization: Digest username="%s", realm="%s", nonce="%s", uri="%s", response="%s"' % (
+                    self._user_b, realm, nonce, uri.encode(), response_hash.encode()),
+            ]
             
             if method == 'REGISTER':
-                headers['Expires'] = '3600'
+                headers.append(b"Expires: 3600")
                 message = self.create_sip_message(method, uri, headers)
             elif method == 'INVITE':
-                headers['Content-Type'] = 'application/sdp'
-                # Add SDP body for INVITE - compatible with voip.ms
-                local_ip = socket.gethostbyname(socket.gethostname())
-                sdp_body = f"""v=0
-o={self.config['username']} 123456 123456 IN IP4 {local_ip}
-s=Python SIP Client
-c=IN IP4 {local_ip}
-t=0 0
-m=audio 10000 RTP/AVP 0 8 18 101
-a=rtpmap:0 PCMU/8000
-a=rtpmap:8 PCMA/8000
-a=rtpmap:18 G729/8000
-a=rtpmap:101 telephone-event/8000
-a=fmtp:101 0-16
-a=sendrecv
-"""
-                message = self.create_sip_message(method, uri, headers, sdp_body)
+                headers.append(b"Content-Type: application/sdp")
+                message = self.create_sip_message(method, uri, headers, self._sdp_body)
             else:
                 message = self.create_sip_message(method, uri, headers)
             
             # Send authenticated request
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Sending authenticated {method} request:[/yellow]\n{message}")
+            if self._debug:
+                console.print(f"[yellow]Sending authenticated {method} request:[/yellow]\n{b''.join(message).decode()}")
 
             # Wait for response
-            response, addr = self.socket.recvfrom(4096)
-            response_str = response.decode()
+            result = self.wait_for_response(message, self.cseq, method)
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Received response:[/yellow]\n{response_str}")
-
-            console.print(f"[blue]Authenticated Response:[/blue]\n{response_str}")
+            if result is None:
+                console.print("[red]Authentication failed: no response from server[/red]")
+                return False
             
-            if "200 OK" in response_str:
+            code, response = result
+            if code == 200:
                 if method == 'REGISTER':
                     self.registered = True
                     console.print("[green]✓ Successfully registered with authentication[/green]")
                 elif method == 'INVITE':
                     console.print("[green]Call connected![/green]")
+                    # Extract remote tag and contact URI from 200 OK response
+                    self.extract_sip_headers(response)
                     self.send_ack()
                 return True
-            elif "100 Trying" in response_str and method == 'INVITE':
-                console.print("[yellow]Call is being processed...[/yellow]")
-                # Wait for more responses
-                try:
-                    response, addr = self.socket.recvfrom(4096)
-                    response_str = response.decode()
-                    console.print(f"[blue]Call Update:[/blue]\n{response_str}")
-                    
-                    if "183 Session Progress" in response_str:
-                        console.print("[blue]Session in progress...[/blue]")
-                        # Wait for more responses
-                        response, addr = self.socket.recvfrom(4096)
-                        response_str = response.decode()
-                        console.print(f"[blue]Call Update:[/blue]\n{response_str}")
-                    
-                    if "180 Ringing" in response_str:
-                        console.print("[blue]Phone is ringing...[/blue]")
-                        # Wait for answer
-                        response, addr = self.socket.recvfrom(4096)
-                        response_str = response.decode()
-                        console.print(f"[blue]Call Update:[/blue]\n{response_str}")
-                    
-                    if "200 OK" in response_str:
-                        console.print("[green]Call connected![/green]")
-                        # Extract remote tag and contact URI from 200 OK response
-                        self.extract_sip_headers(response_str)
-                        self.send_ack()
-                        return True
-                    elif "486 Busy Here" in response_str:
-                        console.print("[yellow]Number is busy[/yellow]")
-                        return False
-                    elif "404 Not Found" in response_str:
-                        console.print("[yellow]Number not found[/yellow]")
-                        return False
-                    elif "480 Temporarily Unavailable" in response_str:
-                        console.print("[yellow]Number temporarily unavailable[/yellow]")
-                        return False
-                    else:
-                        console.print(f"[red]Call failed: {response_str}[/red]")
-                        return False
-                except Exception as e:
-                    console.print(f"[red]Error waiting for call response: {e}[/red]")
-                    return False
+            elif method == 'INVITE':
+                if code == 486:
+                    console.print("[yellow]Number is busy[/yellow]")
+                elif code == 404:
+                    console.print("[yellow]Number not found[/yellow]")
+                elif code == 480:
+                    console.print("[yellow]Number temporarily unavailable[/yellow]")
+                else:
+                    console.print(f"[red]Call failed: {response.decode(errors='replace')}[/red]")
+                return False
             else:
-                console.print(f"[red]Authentication failed: {response_str}[/red]")
+                console.print(f"[red]Authentication failed: {response.decode(errors='replace')}[/red]")
                 return False
                 
         except Exception as e:
@@ -311,83 +411,47 @@ a=sendrecv
             self.local_tag = self.generate_tag()
             self.branch = self.generate_branch()
             self.cseq = 1
+            self.remote_tag = None
             
             # Create INVITE request
             uri = f"sip:{number}@{self.config['domain']}"
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={self.branch}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{number}@{self.config['domain']}>",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} INVITE",
-                'Contact': f"<sip:{self.config['username']}@{socket.gethostname()}:{self.config['port']}>",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0',
-                'Content-Type': 'application/sdp'
-            }
-            
-            # Simple SDP body (Session Description Protocol) - compatible with voip.ms
-            local_ip = socket.gethostbyname(socket.gethostname())
-            sdp_body = f"""v=0
-o={self.config['username']} 123456 123456 IN IP4 {local_ip}
-s=Python SIP Client
-c=IN IP4 {local_ip}
-t=0 0
-m=audio 10000 RTP/AVP 0 8 18 101
-a=rtpmap:0 PCMU/8000
-a=rtpmap:8 PCMA/8000
-a=rtpmap:18 G729/8000
-a=rtpmap:101 telephone-event/8000
-a=fmtp:101 0-16
-a=sendrecv
-"""
+            self._to_uri = f"<{uri}>"
+            self._rebuild_dialog_headers()
+            headers = self._base_headers('INVITE', self.branch) + [
+                self._hdr_contact,
+                b"Content-Type: application/sdp",
+            ]
             
-            message = self.create_sip_message('INVITE', uri, headers, sdp_body)
+            message = self.create_sip_message('INVITE', uri, headers, self._sdp_body)
             
             console.print(f"[blue]Calling {number}...[/blue]")
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Sending INVITE request:[/yellow]\n{message}")
+            if self._debug:
+                console.print(f"[yellow]Sending INVITE request:[/yellow]\n{b''.join(message).decode()}")
 
             # Send INVITE
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
             # Wait for response
-            response, addr = self.socket.recvfrom(4096)
-            response_str = response.decode()
+            result = self.wait_for_response(message, self.cseq, 'INVITE')
             
-            if os.getenv('SIP_CLIENT_DEBUG'):
-                console.print(f"[yellow]Received response:[/yellow]\n{response_str}")
-
-            console.print(f"[blue]Call Response:[/blue]\n{response_str}")
-            
-            if "100 Trying" in response_str:
-                console.print("[yellow]Call is being processed...[/yellow]")
-                # Wait for more responses
-                response, addr = self.socket.recvfrom(4096)
-                response_str = response.decode()
-                console.print(f"[blue]Call Update:[/blue]\n{response_str}")
-            
-            if "180 Ringing" in response_str:
-                console.print("[blue]Phone is ringing...[/blue]")
-                # Wait for answer
-                response, addr = self.socket.recvfrom(4096)
-                response_str = response.decode()
-                console.print(f"[blue]Call Update:[/blue]\n{response_str}")
-            
-            if "401 Unauthorized" in response_str or "407 Proxy Authentication Required" in response_str:
+            if result is None:
+                console.print("[red]Call failed: no response from server[/red]")
+                return False
+            
+            code, response = result
+            if code in (401, 407):
                 # Handle authentication for INVITE
-                return self.handle_authentication(response_str, 'INVITE', uri)
-            elif "200 OK" in response_str:
+                return self.handle_authentication(response, 'INVITE', uri)
+            elif code == 200:
                 console.print("[green]Call connected![/green]")
                 # Extract remote tag and contact URI from 200 OK response
-                self.extract_sip_headers(response_str)
+                self.extract_sip_headers(response)
                 # Send ACK
                 self.send_ack()
                 return True
             else:
-                console.print(f"[red]Call failed: {response_str}[/red]")
+                console.print(f"[red]Call failed: {response.decode(errors='replace')}[/red]")
                 return False
                 
         except Exception as e:
@@ -403,23 +467,12 @@ a=sendrecv
             else:
                 uri = f"sip:{self.config['domain']}"
             
-            # Generate new branch for ACK
-            ack_branch = self.generate_branch()
-            
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={ack_branch}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.remote_tag}",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} ACK",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0'
-            }
+            # ACK gets a new branch
+            headers = self._base_headers('ACK')
             
             message = self.create_sip_message('ACK', uri, headers)
             
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
             console.print(f"[green]ACK sent to {uri}[/green]")
             
@@ -440,37 +493,13 @@ a=sendrecv
             else:
                 uri = f"sip:{self.config['domain']}"
             
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={self.generate_branch()}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.remote_tag}",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} INVITE",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0',
-                'Content-Type': 'application/sdp'
-            }
-            
-            # Simple SDP body for session refresh
-            local_ip = socket.gethostbyname(socket.gethostname())
-            sdp_body = f"""v=0
-o={self.config['username']} 123456 123456 IN IP4 {local_ip}
-s=Python SIP Client
-c=IN IP4 {local_ip}
-t=0 0
-m=audio 10000 RTP/AVP 0 8 18 101
-a=rtpmap:0 PCMU/8000
-a=rtpmap:8 PCMA/8000
-a=rtpmap:18 G729/8000
-a=rtpmap:101 telephone-event/8000
-a=fmtp:101 0-16
-a=sendrecv
-"""
+            headers = self._base_headers('INVITE') + [
+                b"Content-Type: application/sdp",
+            ]
             
-            message = self.create_sip_message('INVITE', uri, headers, sdp_body)
+            message = self.create_sip_message('INVITE', uri, headers, self._sdp_body)
             
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
             console.print("[blue]Session refresh sent[/blue]")
             
@@ -486,30 +515,71 @@ a=sendrecv
             
             self.cseq += 1
             uri = f"sip:{self.config['domain']}"
-            headers = {
-                'Via': f"SIP/2.0/UDP {socket.gethostname()}:{self.config['port']};branch={self.generate_branch()}",
-                'From': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.local_tag}",
-                'To': f"<sip:{self.config['username']}@{self.config['domain']}>;tag={self.remote_tag}",
-                'Call-ID': self.call_id,
-                'CSeq': f"{self.cseq} BYE",
-                'Max-Forwards': '70',
-                'User-Agent': 'Python SIP Client 1.0'
-            }
+            headers = self._base_headers('BYE')
             
             message = self.create_sip_message('BYE', uri, headers)
             
-            server_addr = (self.config['domain'], self.config['port'])
-            self.socket.sendto(message.encode(), server_addr)
+            self.send_message(message, self._server_addr)
             
             console.print("[yellow]Call ended[/yellow]")
             
         except Exception as e:
             console.print(f"[red]Hangup error: {e}[/red]")
     
+    def _wait_for_hangup_with_timer(self):
+        """Block on input(), refreshing the session from a timer thread"""
+        def refresh():
+            nonlocal timer
+            self.send_session_refresh()
+            timer = threading.Timer(_SESSION_REFRESH_INTERVAL, refresh)
+            timer.daemon = True
+            timer.start()
+        
+        timer = threading.Timer(_SESSION_REFRESH_INTERVAL, refresh)
+        timer.daemon = True
+        timer.start()
+        try:
+            input()
+        except EOFError:
+            pass
+        finally:
+            timer.cancel()
+    
+    def wait_for_hangup(self):
+        """Block until the user presses Enter, refreshing the session periodically"""
+        # select() only works on sockets on Windows, and regular files or
+        # closed stdin cannot be registered with epoll; use a timer there
+        if sys.platform == 'win32' or not sys.stdin.isatty():
+            self._wait_for_hangup_with_timer()
+            return
+        
+        try:
+            self._sel.register(sys.stdin, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            self._wait_for_hangup_with_timer()
+            return
+        
+        try:
+            next_refresh = time.monotonic() + _SESSION_REFRESH_INTERVAL
+            while True:
+                for key, _events in self._sel.select(max(0.0, next_refresh - time.monotonic())):
+                    if key.fileobj is sys.stdin:
+                        sys.stdin.readline()
+                        return
+                    # Responses to our refreshes; nothing to act on
+                    self.socket.recvfrom_into(self._rxbuf)
+                
+                if time.monotonic() >= next_refresh:
+                    if self.call_id and self.remote_tag:
+                        self.send_session_refresh()
+                    next_refresh += _SESSION_REFRESH_INTERVAL
+        finally:
+            self._sel.unregister(sys.stdin)
+    
     def cleanup(self):
         """Clean up resources"""
-        if self.socket:
-            self.socket.close()
+        self._sel.close()
+        self.socket.close()
 
 @click.group()
 @click.option('--debug', is_flag=True, help='Enable debug logging')
@@ -536,24 +606,11 @@ def call(number):
             console.print("[green]Call initiated successfully[/green]")
             console.print("[yellow]Call is active. Press Enter to hang up...[/yellow]")
             
-            # Set up session keepalive timer
-            import threading
-            import time
-            
-            def session_keepalive():
-                while client.call_id and client.remote_tag:
-                    time.sleep(30)  # Send refresh every 30 seconds
-                    if client.call_id and client.remote_tag:
-                        client.send_session_refresh()
-            
-            # Start keepalive thread
-            keepalive_thread = threading.Thread(target=session_keepalive, daemon=True)
-            keepalive_thread.start()
-            
             try:
-                input()  # Wait for user input
-                client.hangup()
+                client.wait_for_hangup()  # Refreshes the session until the user hangs up
             except KeyboardInterrupt:
+                pass
+            finally:
                 client.hangup()
         else:
             console.print("[red]Call failed[/red]")
@@ -5,13 +5,15 @@ Audio Device Models - Audio device information and management
 from dataclasses import dataclass
 from typing import List, Optional
 
+from ..models._compat import DATACLASS_SLOTS
+
 try:
     import pyaudio
 except ImportError:
     pyaudio = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AudioDevice:
     """Audio device information"""
 
@@ -47,48 +49,55 @@ class AudioDeviceManager:
         if not pyaudio:
             raise ImportError("pyaudio is required for audio functionality")
         self.audio = pyaudio.PyAudio()
+        self._devices: Optional[List[AudioDevice]] = None
     
     def get_devices(self) -> List[AudioDevice]:
-        """Get list of available audio devices"""
-        devices = []
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            devices.append(AudioDevice(
-                index = i,
-                name = str(info['name']),
-                max_input_channels = int(info['maxInputChannels']),
-                max_output_channels = int(info['maxOutputChannels']),
-                default_sample_rate = float(info['defaultSampleRate'])
-            ))
-        return devices
+        """Get list of available audio devices
+        
+        Enumeration is expensive, so the list is cached until
+        invalidate_device_cache() is called.
+        """
+        if self._devices is None:
+            devices = []
+            for i in range(self.audio.get_device_count()):
+                info = self.audio.get_device_info_by_index(i)
+                devices.append(AudioDevice(
+                    index = i,
+                    name = str(info['name']),
+                    max_input_channels = int(info['maxInputChannels']),
+                    max_output_channels = int(info['maxOutputChannels']),
+                    default_sample_rate = float(info['defaultSampleRate'])
+                ))
+            self._devices = devices
+        return self._devices
+    
+    def invalidate_device_cache(self):
+        """Forget the cached device list, e.g. after a device was plugged in or removed
+        
+        PortAudio only re-enumerates devices once every PyAudio instance in
+        the process has been terminated, so streams must be opened on
+        self.audio rather than on a PyAudio instance of their own. Any
+        stream still open on self.audio is closed by this call.
+        """
+        self.audio.terminate()
+        self.audio = pyaudio.PyAudio()
+        self._devices = None
     
     def get_default_input_device(self) -> Optional[AudioDevice]:
         """Get default input device"""
         try:
-            info = self.audio.get_default_input_device_info()
-            return AudioDevice(
-                index = int(info['index']),
-                name = str(info['name']),
-                max_input_channels = int(info['maxInputChannels']),
-                max_output_channels = int(info['maxOutputChannels']),
-                default_sample_rate = float(info['defaultSampleRate'])
-            )
+            index = int(self.audio.get_default_input_device_info()['index'])
         except Exception:
             return None
+        return next((d for d in self.get_devices() if d.index == index), None)
     
     def get_default_output_device(self) -> Optional[AudioDevice]:
         """Get default output device"""
         try:
-            info = self.audio.get_default_output_device_info()
-            return AudioDevice(
-                index = int(info['index']),
-                name = str(info['name']),
-                max_input_channels = int(info['maxInputChannels']),
-                max_output_channels = int(info['maxOutputChannels']),
-                default_sample_rate = float(info['defaultSampleRate'])
-            )
+            index = int(self.audio.get_default_output_device_info()['index'])
         except Exception:
             return None
+        return next((d for d in self.get_devices() if d.index == index), None)
     
     def validate_device(self, device_index: int, for_input: bool = True) -> bool:
         """Validate if device can be used for input or output"""
@@ -36,6 +36,7 @@ class AudioManager:
         self.current_input_device = None
         self.current_output_device = None
         self.remote_rtp_address = None
+        self._device_refresh_pending = False
         
         # Audio parameters
         self.sample_rate = 8000
@@ -52,6 +53,18 @@ class AudioManager:
         """Get list of available audio devices"""
         return self.device_manager.get_devices()
     
+    def refresh_audio_devices(self):
+        """Re-enumerate audio devices on the next lookup
+        
+        Streams are opened on the device manager's PyAudio handle, and
+        re-initializing PortAudio would close them, so while a stream is
+        open the refresh is deferred until stop_audio_stream().
+        """
+        if self.input_stream or self.output_stream:
+            self._device_refresh_pending = True
+        else:
+            self.device_manager.invalidate_device_cache()
+    
     def get_default_input_device(self) -> Optional[AudioDevice]:
         """Get default input device"""
         return self.device_manager.get_default_input_device()
@@ -88,7 +101,7 @@ class AudioManager:
             
             # Open audio streams
             # print("[uSIP.AudioManager] Opening the streams...")
-            self.input_stream = pyaudio.PyAudio().open(
+            self.input_stream = self.device_manager.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.sample_rate,
@@ -97,7 +110,7 @@ class AudioManager:
                 frames_per_buffer=self.chunk_size
             )
             
-            self.output_stream = pyaudio.PyAudio().open(
+            self.output_stream = self.device_manager.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.sample_rate,
@@ -148,6 +161,10 @@ class AudioManager:
             self.rtp_socket.close()
             self.rtp_socket = None
         
+        if self._device_refresh_pending:
+            self._device_refresh_pending = False
+            self.device_manager.invalidate_device_cache()
+        
         logger.info("Audio streaming stopped")
     
     def switch_input_device(self, device_index: int) -> bool:
@@ -161,7 +178,7 @@ class AudioManager:
                 self.input_stream.stop_stream()
                 self.input_stream.close()
             
-            self.input_stream = pyaudio.PyAudio().open(
+            self.input_stream = self.device_manager.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.sample_rate,
@@ -191,7 +208,7 @@ class AudioManager:
                 self.output_stream.stop_stream()
                 self.output_stream.close()
             
-            self.output_stream = pyaudio.PyAudio().open(
+            self.output_stream = self.device_manager.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.sample_rate,
@@ -219,6 +219,7 @@ class SIPClient:
             call_info.output_device = output_device
             
             call_info.answer_time = time.time()
+            call_info.answer_monotonic = time.monotonic()
             # Deprecated in favor of confirm_call()
             # self._set_call_state(call_info, CallState.CONNECTED)
 
@@ -251,6 +252,7 @@ class SIPClient:
             self.audio_manager.stop_audio_stream()
             
             call_info.end_time = time.time()
+            call_info.end_monotonic = time.monotonic()
             self._set_call_state(call_info, CallState.DISCONNECTED)
             
             # Clean up call
@@ -272,9 +274,16 @@ class SIPClient:
         return self.calls.get(call_id)
     
     def get_audio_devices(self) -> List[AudioDevice]:
-        """Get list of available audio devices"""
+        """Get list of available audio devices (cached after the first call)"""
         return self.audio_manager.get_audio_devices()
     
+    def refresh_audio_devices(self):
+        """Discard the cached device list, e.g. after a device was hot-plugged
+        
+        During a call the refresh takes effect once the audio stream stops.
+        """
+        self.audio_manager.refresh_audio_devices()
+    
     def switch_audio_device(self, call_id: str, input_device: Optional[int] = None, 
                            output_device: Optional[int] = None) -> bool:
         """Switch audio devices during active call"""
@@ -301,7 +310,7 @@ class SIPClient:
     
     def _handle_sip_response(self, message: str, response_code: int):
         """Handle SIP response"""
-        logger.debug(f"SIP response {response_code}: {message}")
+        logger.debug("SIP response %s: %s", response_code, message)
         # print(f"[SIPClient._handle_sip_response: Response is code {response_code}, message {message}]")
         
         # Handle registration responses
@@ -341,6 +350,7 @@ class SIPClient:
                         )
                     
                     call_info.answer_time = time.time()
+                    call_info.answer_monotonic = time.monotonic()
                     self._set_call_state(call_info, CallState.CONNECTED)
                     
                 elif response_code == 180:
@@ -363,7 +373,7 @@ class SIPClient:
     
     def _handle_sip_request(self, message: str, method: str):
         """Handle SIP request"""
-        logger.debug(f"SIP request {method}: {message}")
+        logger.debug("SIP request %s: %s", method, message)
         
         if method == "INVITE":
             self._handle_incoming_invite(message)
@@ -425,6 +435,7 @@ class SIPClient:
             self.audio_manager.stop_audio_stream()
             
             call_info.end_time = time.time()
+            call_info.end_monotonic = time.monotonic()
             self._set_call_state(call_info, CallState.DISCONNECTED)
             
             # Clean up
@@ -0,0 +1,9 @@
+"""
+Dataclass options that depend on the running Python version
+"""
+
+import sys
+
+# dataclass(slots=True) only exists on Python 3.10+; older interpreters
+# fall back to a regular __dict__-backed dataclass.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -2,11 +2,14 @@
 SIP Account Model - Account configuration for SIP client
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SIPAccount:
     """SIP account configuration"""
     username: str
@@ -14,6 +17,7 @@ class SIPAccount:
     domain: str
     port: int = 5060
     display_name: Optional[str] = None
+    _uri: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate account configuration"""
@@ -22,11 +26,16 @@ class SIPAccount:
         
         if self.port <= 0 or self.port > 65535:
             raise ValueError("Port must be between 1 and 65535")
+        
+        # Identity strings end up in every header and in dict keys
+        object.__setattr__(self, 'username', sys.intern(self.username))
+        object.__setattr__(self, 'domain', sys.intern(self.domain))
+        object.__setattr__(self, '_uri', f"sip:{self.username}@{self.domain}")
     
     @property
     def uri(self) -> str:
         """Get the SIP URI for this account"""
-        return f"sip:{self.username}@{self.domain}"
+        return self._uri
     
     def __str__(self) -> str:
         return f"{self.username}@{self.domain}:{self.port}"
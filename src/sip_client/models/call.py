@@ -2,12 +2,16 @@
 SIP Call Model - Call information and state tracking
 """
 
+import time
 from dataclasses import dataclass, field
 from typing import Optional, Any
+from ._compat import DATACLASS_SLOTS
 from .enums import CallState
 
+_ACTIVE_STATES = frozenset({CallState.CALLING, CallState.RINGING, CallState.CONNECTED})
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CallInfo:
     """Call information and state tracking"""
     
@@ -37,9 +41,16 @@ class CallInfo:
     # Sledghehammer approach for networking. AI-assisted. Beware.
     original_invite: Optional[str] = None
     
+    # Monotonic counterparts of answer_time/end_time, used for duration
+    answer_monotonic: Optional[float] = None
+    end_monotonic: Optional[float] = None
+    
     @property
     def duration(self) -> float:
-        """Calculate call duration in seconds"""
+        """Calculate call duration in seconds (elapsed so far if still up)"""
+        if self.answer_monotonic is not None:
+            end = self.end_monotonic if self.end_monotonic is not None else time.monotonic()
+            return end - self.answer_monotonic
         if self.answer_time and self.end_time:
             return self.end_time - self.answer_time
         return 0.0
@@ -47,7 +58,7 @@ class CallInfo:
     @property
     def is_active(self) -> bool:
         """Check if call is currently active"""
-        return self.state in [CallState.CALLING, CallState.RINGING, CallState.CONNECTED]
+        return self.state in _ACTIVE_STATES
     
     @property
     def is_incoming(self) -> bool:
@@ -5,7 +5,7 @@ SIP Client Enums - State enumerations for SIP client library
 from enum import Enum
 
 
-class CallState(Enum):
+class CallState(str, Enum):
     """Call state enumeration"""
     IDLE = "idle"
     CALLING = "calling"
@@ -16,7 +16,7 @@ class CallState(Enum):
     FAILED = "failed"
 
 
-class RegistrationState(Enum):
+class RegistrationState(str, Enum):
     """Registration state enumeration"""
     UNREGISTERED = "unregistered"
     REGISTERING = "registering"
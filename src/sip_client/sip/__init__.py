@@ -5,10 +5,12 @@ SIP Client Protocol - SIP protocol implementation
 from .protocol import SIPProtocol
 from .authentication import SIPAuthenticator
 from .messages import SIPMessageBuilder, SIPMessageParser
+from .reactor import SIPReactor
 
 __all__ = [
     "SIPProtocol",
     "SIPAuthenticator",
     "SIPMessageBuilder",
     "SIPMessageParser",
+    "SIPReactor",
 ] 
\ No newline at end of file
@@ -6,6 +6,34 @@ import re
 from typing import Dict, Optional, Tuple
 from ..utils.helpers import get_hostname, get_local_ip
 
+# name-addr form: "Display" <sip:user@host>;params
+_ANGLE_URI_RE = re.compile(r'<([^>]*)>')
+# addr-spec form: sip:user@host;params
+_BARE_URI_RE = re.compile(r'\s*([^;\s]+)')
+_TAG_RE = re.compile(r'tag=([^;]*)')
+
+# Audio offer, split around the RTP port which is the only per-call value
+_SDP_SESSION = """v=0
+o={username} 123456 123456 IN IP4 {local_ip}
+s=Python SIP Client Library
+c=IN IP4 {local_ip}
+t=0 0
+m=audio """
+_SDP_MEDIA = """ RTP/AVP 0 8 18 101
+a=rtpmap:0 PCMU/8000
+a=rtpmap:8 PCMA/8000
+a=rtpmap:18 G729/8000
+a=rtpmap:101 telephone-event/8000
+a=fmtp:101 0-16
+a=sendrecv
+"""
+
+
+def _header_uri(value: str) -> Optional[str]:
+    """Return the URI from a From/To/Contact header value"""
+    match = _ANGLE_URI_RE.search(value) or _BARE_URI_RE.match(value)
+    return match.group(1) if match else None
+
 
 class SIPMessageBuilder:
     """Builder for SIP messages"""
@@ -24,6 +52,14 @@ class SIPMessageBuilder:
         
         return message
     
+    @staticmethod
+    def encode_message(method: str, uri: str, headers: Dict[str, str], body: bytes = b"") -> bytes:
+        """Create a SIP message as wire-ready bytes"""
+        lines = [f"{method} {uri} SIP/2.0"]
+        lines.extend(f"{header}: {value}" for header, value in headers.items())
+        lines.append(f"Content-Length: {len(body)}\r\n\r\n")
+        return "\r\n".join(lines).encode() + body
+    
     @staticmethod
     def create_register_headers(username: str, domain: str, port: int, 
                                local_tag: str, branch: str, call_id: str, 
@@ -91,20 +127,14 @@ class SIPMessageBuilder:
     @staticmethod
     def create_sdp_body(username: str, rtp_port: int) -> str:
         """Create SDP body for audio call"""
-        local_ip = get_local_ip()
-        return f"""v=0
-o={username} 123456 123456 IN IP4 {local_ip}
-s=Python SIP Client Library
-c=IN IP4 {local_ip}
-t=0 0
-m=audio {rtp_port} RTP/AVP 0 8 18 101
-a=rtpmap:0 PCMU/8000
-a=rtpmap:8 PCMA/8000
-a=rtpmap:18 G729/8000
-a=rtpmap:101 telephone-event/8000
-a=fmtp:101 0-16
-a=sendrecv
-"""
+        session = _SDP_SESSION.format(username=username, local_ip=get_local_ip())
+        return f"{session}{rtp_port}{_SDP_MEDIA}"
+    
+    @staticmethod
+    def create_sdp_parts(username: str, local_ip: str) -> Tuple[bytes, bytes]:
+        """Create the encoded SDP before and after the RTP port"""
+        session = _SDP_SESSION.format(username=username, local_ip=local_ip)
+        return session.encode(), _SDP_MEDIA.encode()
 
 
 class SIPMessageParser:
@@ -112,53 +142,66 @@ class SIPMessageParser:
     
     @staticmethod
     def parse_headers(message: str) -> Dict[str, str]:
-        """Parse SIP headers from message"""
-        headers = {}
-        lines = message.split('\r\n')
+        """Parse SIP headers from message
+        
+        Walks the header block once with find() rather than splitting the
+        whole message into lines. Keys are lowercased so lookups are a
+        plain dict get regardless of how the peer capitalised the header.
+        """
+        headers: Dict[str, str] = {}
+        end = message.find('\r\n\r\n')
+        if end == -1:
+            end = len(message)
+        
+        # Skip first line (request/response line)
+        pos = message.find('\r\n') + 2
+        if pos == 1:
+            return headers
         
-        for line in lines[1:]:  # Skip first line (request/response line)
-            if not line.strip():
-                break
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
+        while pos < end:
+            eol = message.find('\r\n', pos, end)
+            if eol == -1:
+                eol = end
+            
+            colon = message.find(':', pos, eol)
+            if colon != -1:
+                name = message[pos:colon].strip()
+                key = name.lower()
+                value = message[colon + 1:eol].strip()
                 
                 if key in headers:
                     # Concatenate multiple same-name headers with CRLF
-                    headers[key] += f"\r\n{key}: {value}"
+                    headers[key] += f"\r\n{name}: {value}"
                 else:
                     headers[key] = value
+            
+            pos = eol + 2
         
         return headers
     
     @staticmethod
     def extract_tag(header: str) -> Optional[str]:
         """Extract tag from From or To header"""
-        if 'tag=' in header:
-            return header.split('tag=')[1].split(';')[0].strip()
-        return None
+        match = _TAG_RE.search(header)
+        return match.group(1).strip() if match else None
     
     @staticmethod
     def extract_contact_uri(header: str) -> Optional[str]:
         """Extract contact URI from Contact header"""
-        if '<' in header and '>' in header:
-            return header.split('<')[1].split('>')[0].strip()
-        else:
-            # Simple format without < >
-            return header.split('Contact:')[1].strip().split(';')[0].strip()
+        uri = _header_uri(header)
+        return uri.strip() if uri else None
     
     @staticmethod
     def extract_call_id(message: str) -> Optional[str]:
         """Extract Call-ID from SIP message"""
         headers = SIPMessageParser.parse_headers(message)
-        return headers.get('Call-ID')
+        return headers.get('call-id')
     
     @staticmethod
     def extract_cseq(message: str) -> Optional[Tuple[int, str]]:
         """Extract CSeq number and method from SIP message"""
         headers = SIPMessageParser.parse_headers(message)
-        cseq_header = headers.get('CSeq')
+        cseq_header = headers.get('cseq')
         if cseq_header:
             parts = cseq_header.split(' ', 1)
             if len(parts) == 2:
@@ -172,58 +215,51 @@ class SIPMessageParser:
     def extract_from_uri(message: str) -> Optional[str]:
         """Extract URI from From header"""
         headers = SIPMessageParser.parse_headers(message)
-        from_header = headers.get('From')
+        from_header = headers.get('from')
         if from_header:
-            if '<' in from_header and '>' in from_header:
-                return from_header.split('<')[1].split('>')[0]
-            else:
-                return from_header.split(':')[1].split(';')[0]
+            return _header_uri(from_header)
         return None
     
     @staticmethod
     def extract_to_uri(message: str) -> Optional[str]:
         """Extract URI from To header"""
         headers = SIPMessageParser.parse_headers(message)
-        to_header = headers.get('To')
+        to_header = headers.get('to')
         if to_header:
-            if '<' in to_header and '>' in to_header:
-                return to_header.split('<')[1].split('>')[0]
-            else:
-                return to_header.split(':')[1].split(';')[0]
+            return _header_uri(to_header)
         return None
     
     @staticmethod
     def get_response_code(message: str) -> Optional[int]:
         """Extract response code from SIP response"""
-        lines = message.split('\r\n')
-        if lines:
-            first_line = lines[0]
-            if first_line.startswith('SIP/2.0'):
-                parts = first_line.split(' ')
-                if len(parts) >= 2:
-                    try:
-                        return int(parts[1])
-                    except ValueError:
-                        pass
+        if message.startswith('SIP/2.0 '):
+            eol = message.find('\r\n')
+            if eol == -1:
+                eol = len(message)
+            end = message.find(' ', 8, eol)
+            try:
+                return int(message[8:end if end != -1 else eol])
+            except ValueError:
+                pass
         return None
     
     @staticmethod
     def get_method(message: str) -> Optional[str]:
         """Extract method from SIP request"""
-        lines = message.split('\r\n')
-        if lines:
-            first_line = lines[0]
-            if not first_line.startswith('SIP/2.0'):
-                parts = first_line.split(' ')
-                if len(parts) >= 1:
-                    return parts[0]
+        if not message.startswith('SIP/2.0'):
+            eol = message.find('\r\n')
+            if eol == -1:
+                eol = len(message)
+            end = message.find(' ', 0, eol)
+            return message[:end if end != -1 else eol]
         return None
     
     @staticmethod
     def extract_sdp_body(message: str) -> Optional[str]:
         """Extract SDP body from SIP message"""
-        if '\r\n\r\n' in message:
-            return message.split('\r\n\r\n')[1]
+        end = message.find('\r\n\r\n')
+        if end != -1:
+            return message[end + 4:]
         return None
     
     @staticmethod
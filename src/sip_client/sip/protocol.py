@@ -3,17 +3,16 @@ SIP Protocol - Core SIP protocol handling
 """
 
 import socket
-import select
-import threading
 import logging
-from typing import Dict, Optional, Tuple, Callable, Any
+from typing import Dict, Optional, Tuple, Callable, Any, Union
 
 from .messages import SIPMessageBuilder, SIPMessageParser
 from .authentication import SIPAuthenticator
+from .reactor import SIPReactor
 from ..models.account import SIPAccount
 from ..models.call import CallInfo
 from ..models.enums import CallState
-from ..utils.helpers import generate_call_id, generate_tag, generate_branch
+from ..utils.helpers import generate_call_id, generate_tag, generate_branch, get_local_ip
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +24,18 @@ class SIPProtocol:
         self.account = account
         self.authenticator = SIPAuthenticator(account)
         self.socket = None
-        self.message_thread = None
         self.listening = False
         self.cseq = 1
         
+        # Encoded SDP around the RTP port, built for the local IP it was made with
+        self._sdp_ip: Optional[str] = None
+        self._sdp_prefix = b""
+        self._sdp_suffix = b""
+        
+        # Reused receive buffer, sized for the largest UDP datagram
+        self._rx_buf = bytearray(65535)
+        self._rx_view = memoryview(self._rx_buf)
+        
         # Callbacks
         self.on_message_received: Optional[Callable[[str, Tuple[str, int]], None]] = None
         self.on_response_received: Optional[Callable[[str, int], None]] = None
@@ -38,12 +45,11 @@ class SIPProtocol:
         """Start the SIP protocol handler"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(10)
+            self.socket.setblocking(False)
             
-            # Start message listener
+            # Incoming messages are dispatched from the shared reactor thread
             self.listening = True
-            self.message_thread = threading.Thread(target=self._message_listener, daemon=True)
-            self.message_thread.start()
+            SIPReactor.instance().register(self.socket, self._handle_readable)
             
             logger.info("SIP protocol started")
             return True
@@ -57,19 +63,33 @@ class SIPProtocol:
         self.listening = False
         
         if self.socket:
+            SIPReactor.instance().unregister(self.socket)
             self.socket.close()
             self.socket = None
         
         logger.info("SIP protocol stopped")
     
-    def send_message(self, message: str, address: Optional[Tuple[str, int]] = None) -> bool:
+    def _sdp_parts(self) -> Tuple[bytes, bytes]:
+        """Get the encoded SDP around the RTP port, rebuilt if the local IP changed"""
+        local_ip = get_local_ip()
+        if local_ip != self._sdp_ip:
+            self._sdp_prefix, self._sdp_suffix = SIPMessageBuilder.create_sdp_parts(
+                self.account.username, local_ip
+            )
+            self._sdp_ip = local_ip
+        return self._sdp_prefix, self._sdp_suffix
+    
+    def send_message(self, message: Union[str, bytes], address: Optional[Tuple[str, int]] = None) -> bool:
         """Send SIP message"""
         try:
             if address is None:
                 address = (self.account.domain, self.account.port)
             
-            self.socket.sendto(message.encode(), address)
-            logger.debug(f"Sent message to {address}: {message}")
+            data = message if isinstance(message, bytes) else message.encode()
+            self.socket.sendto(data, address)
+            if logger.isEnabledFor(logging.DEBUG):
+                text = message if isinstance(message, str) else message.decode('utf-8', 'replace')
+                logger.debug("Sent message to %s: %s", address, text)
             return True
             
         except Exception as e:
@@ -118,10 +138,11 @@ class SIPProtocol:
                 target_uri, local_tag, branch, call_id, self.cseq
             )
             
-            # Create SDP body
-            body = SIPMessageBuilder.create_sdp_body(self.account.username, rtp_port)
+            # Create SDP body; only the RTP port varies between calls
+            prefix, suffix = self._sdp_parts()
+            body = prefix + str(rtp_port).encode() + suffix
             
-            message = SIPMessageBuilder.create_message('INVITE', target_uri, headers, body)
+            message = SIPMessageBuilder.encode_message('INVITE', target_uri, headers, body)
             
             # Send message
             result = self.send_message(message)
@@ -197,8 +218,8 @@ class SIPProtocol:
 
             # WARN AI-assisted code. Check here for breakage.
 
-            from_header = headers.get("From", "")
-            to_header = headers.get("To", "")
+            from_header = headers.get("from", "")
+            to_header = headers.get("to", "")
             if "tag=" not in to_header:
                 to_header += f";tag={generate_tag()}"
 
@@ -206,7 +227,7 @@ class SIPProtocol:
             response_line = f"SIP/2.0 {response_code} {response_text}"
             message = f"{response_line}\r\n"
 
-            for via in headers.get("Via", "").split('\r\n', 1):
+            for via in headers.get("via", "").split('\r\n', 1):
                 if via.startswith("Via: "):
                     message += f"{via}\r\n"
                 else:
@@ -220,10 +241,10 @@ class SIPProtocol:
 
             message += f"To: {to_header}\r\n"
             message += f"From: {from_header}\r\n"
-            message += f"Call-ID: {headers.get('Call-ID', '')}\r\n"
-            message += f"CSeq: {headers.get('CSeq', '')}\r\n"
+            message += f"Call-ID: {headers.get('call-id', '')}\r\n"
+            message += f"CSeq: {headers.get('cseq', '')}\r\n"
             # message += "Allow: INVITE, ACK, OPTIONS, CANCEL, BYE, SUBSCRIBE, NOTIFY, INFO, REFER, UPDATE\r\n"
-            message += f"Allow: {headers.get('Allow', '')}\r\n"
+            message += f"Allow: {headers.get('allow', '')}\r\n"
             message += f"User-Agent: uSIP 0.1\r\n"
 
             if body:
@@ -266,37 +287,40 @@ class SIPProtocol:
             logger.error(f"Failed to handle auth challenge: {e}")
             return False
     
-    def _message_listener(self):
-        """Listen for incoming SIP messages"""
-        while self.listening:
+    def _handle_readable(self):
+        """Reactor callback for incoming SIP messages"""
+        try:
+            self._drain_socket()
+        except Exception as e:
+            if self.listening:
+                logger.error("Message listener error: %s", e)
+    
+    def _drain_socket(self):
+        """Handle every datagram already queued on the socket"""
+        while True:
             try:
-                if self.socket:
-                    ready = select.select([self.socket], [], [], 1.0)
-                    if ready[0]:
-                        data, addr = self.socket.recvfrom(4096)
-                        message = data.decode()
-                        # print("[SIPProtocol._messasge_listener: About to handle incoming message]")
-                        self._handle_incoming_message(message, addr)
-            except Exception as e:
-                if self.listening:
-                    logger.error(f"Message listener error: {e}")
+                nbytes, addr = self.socket.recvfrom_into(self._rx_buf)
+            except BlockingIOError:
+                return
+            # RFC 5626 CRLF keep-alives carry no SIP message
+            if nbytes <= 4 and not self._rx_buf[:nbytes].strip():
+                continue
+            # Headers are ASCII; only display names or bodies may carry UTF-8,
+            # so a stray invalid byte should not cost us the whole message
+            message = str(self._rx_view[:nbytes], 'utf-8', 'replace')
+            # print("[SIPProtocol._messasge_listener: About to handle incoming message]")
+            self._handle_incoming_message(message, addr)
     
     def _handle_incoming_message(self, message: str, addr: Tuple[str, int]):
         """Handle incoming SIP message"""
-        logger.debug(f"Received message from {addr}: {message}")
+        logger.debug("Received message from %s: %s", addr, message)
         
         # Notify callback
         if self.on_message_received:
             self.on_message_received(message, addr)
         
         # Parse message type
-        lines = message.split('\r\n')
-        if not lines:
-            return
-        
-        first_line = lines[0]
-        
-        if first_line.startswith('SIP/2.0'):
+        if message.startswith('SIP/2.0'):
             # Response
             response_code = SIPMessageParser.get_response_code(message)
             if response_code and self.on_response_received:
@@ -312,7 +336,7 @@ class SIPProtocol:
         headers = SIPMessageParser.parse_headers(message)
         
         info = {
-            'call_id': headers.get('Call-ID'),
+            'call_id': headers.get('call-id'),
             'from_uri': SIPMessageParser.extract_from_uri(message),
             'to_uri': SIPMessageParser.extract_to_uri(message),
             'from_tag': None,
@@ -326,13 +350,13 @@ class SIPProtocol:
         }
         
         # Extract tags
-        if 'From' in headers:
-            info['from_tag'] = SIPMessageParser.extract_tag(headers['From'])
-        if 'To' in headers:
-            info['to_tag'] = SIPMessageParser.extract_tag(headers['To'])
+        if 'from' in headers:
+            info['from_tag'] = SIPMessageParser.extract_tag(headers['from'])
+        if 'to' in headers:
+            info['to_tag'] = SIPMessageParser.extract_tag(headers['to'])
         
         # Extract contact URI
-        if 'Contact' in headers:
-            info['contact_uri'] = SIPMessageParser.extract_contact_uri(headers['Contact'])
+        if 'contact' in headers:
+            info['contact_uri'] = SIPMessageParser.extract_contact_uri(headers['contact'])
         
         return info 
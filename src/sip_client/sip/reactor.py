@@ -0,0 +1,73 @@
+"""
+SIP Reactor - Shared selector loop for SIP sockets
+"""
+
+import selectors
+import socket
+import threading
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SIPReactor:
+    """Single thread that waits on every registered SIP socket
+
+    Each registered socket carries a callback that is run on the reactor
+    thread whenever the socket becomes readable. The thread is started by
+    the first registration and exits once the last socket is removed.
+    """
+
+    _instance: Optional["SIPReactor"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.selector = selectors.DefaultSelector()
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "SIPReactor":
+        """Get the process-wide reactor"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def register(self, sock: socket.socket, callback: Callable[[], None]) -> None:
+        """Watch a socket and call callback whenever it is readable"""
+        with self.lock:
+            self.selector.register(sock, selectors.EVENT_READ, callback)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="sip-reactor", daemon=True)
+                self.thread.start()
+
+    def unregister(self, sock: socket.socket) -> None:
+        """Stop watching a socket (must be called before it is closed)"""
+        with self.lock:
+            try:
+                self.selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+
+    def _run(self) -> None:
+        """Dispatch readable sockets until none are left"""
+        while True:
+            with self.lock:
+                if not self.selector.get_map():
+                    self.thread = None
+                    return
+
+            try:
+                events = self.selector.select(0.5)
+            except OSError as e:
+                # The last socket may have gone away between the check and select()
+                logger.debug("SIP reactor select error: %s", e)
+                continue
+
+            for key, _ in events:
+                try:
+                    key.data()
+                except Exception as e:
+                    logger.error("SIP reactor callback error: %s", e)
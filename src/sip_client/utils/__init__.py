@@ -2,10 +2,11 @@
 SIP Client Utils - Utility functions and helpers
 """
 
-from .helpers import generate_call_id, generate_tag, generate_branch
+from .helpers import generate_call_id, generate_tag, generate_branch, invalidate_network_cache
 
 __all__ = [
     "generate_call_id",
     "generate_tag", 
     "generate_branch",
+    "invalidate_network_cache",
 ] 
\ No newline at end of file
@@ -2,37 +2,43 @@
 Utility functions for SIP client
 """
 
+import os
 import random
 import socket
+import time
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# How long a STUN-discovered public address is trusted before re-querying
+PUBLIC_IP_TTL = 300.0
+
+_public_ip_cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
 
 
 def generate_call_id(domain: str = None) -> str: # type: ignore
     """Generate a unique call ID"""
     if domain is None:
         domain = socket.gethostname()
-    return f"{random.randint(100000, 999999)}@{domain}"
+    return f"{os.urandom(8).hex()}@{domain}"
 
 
 def generate_tag() -> str:
     """Generate a unique tag"""
-    return f"{random.randint(100000, 999999)}"
+    return os.urandom(4).hex()
 
 
 def generate_branch() -> str:
     """Generate a unique branch identifier"""
-    return f"z9hG4bK{random.randint(100000, 999999)}"
-
-
-# def get_local_ip() -> str:
-#     """Get local IP address"""
-#     return socket.gethostbyname(socket.gethostname())
+    return "z9hG4bK" + os.urandom(4).hex()
 
 
+@lru_cache(maxsize=1)
 def get_hostname() -> str:
     """Get local hostname"""
     return socket.gethostname() 
 
 
+@lru_cache(maxsize=1)
 def get_local_ip() -> str:
     """Get the primary local IPv4 address."""
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -50,17 +56,33 @@ def get_public_ip(
     """
     Discover the public IP address using a STUN server.
     
+    The result is cached per STUN server for PUBLIC_IP_TTL seconds.
+    
     Returns:
         str: The detected public IPv4 address.
     Raises:
         RuntimeError: If detection fails.
     """
+    key = (stun_host, stun_port)
+    cached = _public_ip_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now < cached[1]:
+        return cached[0]
+    
     import stun
     nat_type, external_ip, external_port = stun.get_ip_info(stun_host=stun_host, stun_port=stun_port)
     if not external_ip:
         raise RuntimeError("Failed to detect public IP via STUN.")
+    
+    _public_ip_cache[key] = (str(external_ip), now + PUBLIC_IP_TTL)
     return str(external_ip)
 
+def invalidate_network_cache() -> None:
+    """Forget cached hostname, local and public IP (e.g. after a network change)"""
+    get_hostname.cache_clear()
+    get_local_ip.cache_clear()
+    _public_ip_cache.clear()
+
 def get_free_udp_port(range_min: int = 10000, range_max: int = 20000):
     # Try a few random ports in the RTP range first, fallback to OS-chosen
     for _ in range(6):
@@ -0,0 +1,74 @@
+"""
+Tests for SIP message parsing
+"""
+
+from sip_client.sip.messages import SIPMessageParser
+
+
+INVITE = (
+    "INVITE sip:100@example.com SIP/2.0\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK1\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.2:5060;branch=z9hG4bK2\r\n"
+    "From: <sip:alice@example.com>;tag=abc\r\n"
+    "To: <sip:100@example.com>\r\n"
+    "Call-ID: 1234@example.com\r\n"
+    "CSeq: 1 INVITE\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+
+
+class TestGetMethod:
+    def test_request_line(self):
+        assert SIPMessageParser.get_method(INVITE) == "INVITE"
+
+    def test_start_line_without_spaces(self):
+        assert SIPMessageParser.get_method("BYE\r\nCall-ID: z\r\n\r\n") == "BYE"
+
+    def test_message_without_line_break(self):
+        assert SIPMessageParser.get_method("OPTIONS") == "OPTIONS"
+
+    def test_response_has_no_method(self):
+        assert SIPMessageParser.get_method("SIP/2.0 200 OK\r\n\r\n") is None
+
+
+class TestGetResponseCode:
+    def test_status_line(self):
+        assert SIPMessageParser.get_response_code("SIP/2.0 180 Ringing\r\n\r\n") == 180
+
+    def test_status_line_without_reason(self):
+        message = "SIP/2.0 486\r\nVia: SIP/2.0/UDP 10.0.0.1:5060\r\n\r\n"
+        assert SIPMessageParser.get_response_code(message) == 486
+
+    def test_message_without_line_break(self):
+        assert SIPMessageParser.get_response_code("SIP/2.0 404") == 404
+
+    def test_request_has_no_code(self):
+        assert SIPMessageParser.get_response_code(INVITE) is None
+
+    def test_malformed_code(self):
+        assert SIPMessageParser.get_response_code("SIP/2.0 OK\r\n\r\n") is None
+
+
+class TestParseHeaders:
+    def test_keys_are_lowercased(self):
+        headers = SIPMessageParser.parse_headers(INVITE)
+        assert headers["call-id"] == "1234@example.com"
+        assert headers["cseq"] == "1 INVITE"
+        assert "Call-ID" not in headers
+
+    def test_duplicate_headers_are_concatenated(self):
+        headers = SIPMessageParser.parse_headers(INVITE)
+        assert headers["via"] == (
+            "SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK1\r\n"
+            "Via: SIP/2.0/UDP 10.0.0.2:5060;branch=z9hG4bK2"
+        )
+
+    def test_body_is_not_parsed(self):
+        message = "SIP/2.0 200 OK\r\nContent-Type: application/sdp\r\n\r\nv=0\r\no=x: y\r\n"
+        headers = SIPMessageParser.parse_headers(message)
+        assert headers == {"content-type": "application/sdp"}
+
+    def test_message_without_headers(self):
+        assert SIPMessageParser.parse_headers("SIP/2.0 200 OK\r\n\r\n") == {}
+        assert SIPMessageParser.parse_headers("SIP/2.0 200 OK") == {}
@@ -6,8 +6,6 @@ A command-line interface for making SIP calls using the modular library
 
 import os
 import sys
-import time
-import threading
 import logging
 import click
 from rich.console import Console
@@ -109,18 +107,6 @@ class SimpleSIPClientCLI:
                 console.print("[green]Call initiated successfully[/green]")
                 console.print("[yellow]Call is active. Press Enter to hang up...[/yellow]")
                 
-                # Set up session keepalive (simplified)
-                def session_keepalive():
-                    while self.active_call_id:
-                        time.sleep(30)
-                        # In a real implementation, we'd send keepalive messages
-                        if self.active_call_id:
-                            logging.info("Session keepalive")
-                
-                # Start keepalive thread
-                keepalive_thread = threading.Thread(target=session_keepalive, daemon=True)
-                keepalive_thread.start()
-                
                 try:
                     input()  # Wait for user input
                     self.hangup()